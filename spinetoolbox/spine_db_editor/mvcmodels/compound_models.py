@@ -40,12 +40,18 @@ class CompoundModelBase(CompoundWithEmptyTableModel):
         self.db_mngr = db_mngr
         self.db_maps = db_maps
         self._filter_class_ids = {}
+        self._pending_ids = {}  # Maps (db_map, entity_class_id, committed) to ids waiting for a single model
         self._auto_filter_menus = {}
         self._auto_filter = {}
         self._filter_timer = QTimer(self)
         self._filter_timer.setSingleShot(True)
         self._filter_timer.setInterval(100)
         self._filter_timer.timeout.connect(self.refresh)
+        self._updated_ids = {}  # Maps (db_map, entity_class_id) to updated ids waiting for dataChanged
+        self._data_changed_timer = QTimer(self)
+        self._data_changed_timer.setSingleShot(True)
+        self._data_changed_timer.setInterval(50)
+        self._data_changed_timer.timeout.connect(self._emit_data_changed_for_updated_items)
         self._fetch_parent = FlexibleFetchParent(
             self.item_type,
             shows_item=self.shows_item,
@@ -112,6 +118,8 @@ class CompoundModelBase(CompoundWithEmptyTableModel):
         """Initializes the model."""
         super().init_model()
         self._filter_class_ids = {}
+        self._pending_ids = {}
+        self._updated_ids = {}
         self._auto_filter = {}
         self.empty_model.fetchMore(QModelIndex())
         while self._auto_filter_menus:
@@ -183,6 +191,24 @@ class CompoundModelBase(CompoundWithEmptyTableModel):
         class_ids = self._filter_class_ids.get(model.db_map, set())
         return model.entity_class_id in class_ids or bool(set(model.dimension_id_list) & class_ids)
 
+    def _class_filter_accepts_class(self, db_map, entity_class_id):
+        """Returns True if the class filter would accept a single model for given entity class.
+
+        Args:
+            db_map (DatabaseMapping): database map
+            entity_class_id (int): entity class id
+
+        Returns:
+            bool
+        """
+        if not self._filter_class_ids:
+            return True
+        class_ids = self._filter_class_ids.get(db_map, set())
+        if entity_class_id in class_ids:
+            return True
+        dimension_id_list = self.db_mngr.get_item(db_map, "entity_class", entity_class_id).get("dimension_id_list", ())
+        return bool(set(dimension_id_list) & class_ids)
+
     def _auto_filter_accepts_model(self, model):
         if None in self._auto_filter.values():
             return False
@@ -216,8 +242,29 @@ class CompoundModelBase(CompoundWithEmptyTableModel):
     def set_filter_class_ids(self, class_ids):
         if class_ids != self._filter_class_ids:
             self._filter_class_ids = class_ids
+            self._create_pending_single_models()
             self._invalidate_filter()
 
+    def _create_pending_single_models(self):
+        """Creates single models for pending ids whose entity classes now pass the class filter."""
+        for key in list(self._pending_ids):
+            db_map, entity_class_id, committed = key
+            if not self._class_filter_accepts_class(db_map, entity_class_id):
+                continue
+            ids = self._pending_ids.pop(key)
+            self._add_items(db_map, entity_class_id, ids, committed)
+
+    def _pending_item_ids(self, db_map):
+        """Returns ids that wait for a single model in given database map.
+
+        Args:
+            db_map (DatabaseMapping): database map
+
+        Returns:
+            set: item ids
+        """
+        return set().union(*(ids for (map_, _, _), ids in self._pending_ids.items() if map_ is db_map))
+
     def clear_auto_filter(self):
         self._auto_filter = {}
         self._invalidate_filter()
@@ -321,7 +368,7 @@ class CompoundModelBase(CompoundWithEmptyTableModel):
             if db_map not in self.db_maps:
                 continue
             db_map_single_models = [m for m in self.single_models if m.db_map is db_map]
-            existing_ids = set().union(*(m.item_ids() for m in db_map_single_models))
+            existing_ids = set().union(*(m.item_ids() for m in db_map_single_models), self._pending_item_ids(db_map))
             items_per_class = self._items_per_class(items)
             for entity_class_id, class_items in items_per_class.items():
                 ids_committed = []
@@ -352,6 +399,8 @@ class CompoundModelBase(CompoundWithEmptyTableModel):
 
     def _add_items(self, db_map, entity_class_id, ids, committed):
         """Creates new single model and resets it with the given parameter ids.
+        If the entity class does not pass the class filter, the ids are put on hold
+        and the model gets created once the filter accepts the class.
 
         Args:
             db_map (DatabaseMapping): database map
@@ -361,6 +410,9 @@ class CompoundModelBase(CompoundWithEmptyTableModel):
         """
         if not ids:
             return
+        if not self._class_filter_accepts_class(db_map, entity_class_id):
+            self._pending_ids.setdefault((db_map, entity_class_id, committed), []).extend(ids)
+            return
         if committed:
             existing = next(
                 (m for m in self.single_models if (m.db_map, m.entity_class_id) == (db_map, entity_class_id)), None
@@ -373,16 +425,41 @@ class CompoundModelBase(CompoundWithEmptyTableModel):
 
     def handle_items_updated(self, db_map_data):
         """Runs when either parameter definitions or values are updated in the dbs.
-        Emits dataChanged so the parameter_name column is refreshed.
+        Collects the updated ids so that dataChanged gets emitted for the affected rows only
+        and a burst of updates results in a single batch of emissions.
 
         Args:
             db_map_data (dict): list of updated dict-items keyed by DatabaseMapping
         """
-        if all(db_map not in self.db_maps for db_map in db_map_data):
-            return
-        self.dataChanged.emit(
-            self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1), [Qt.ItemDataRole.DisplayRole]
-        )
+        for db_map, items in db_map_data.items():
+            if db_map not in self.db_maps:
+                continue
+            for entity_class_id, class_items in self._items_per_class(items).items():
+                self._updated_ids.setdefault((db_map, entity_class_id), set()).update(x["id"] for x in class_items)
+        if self._updated_ids and not self._data_changed_timer.isActive():
+            self._data_changed_timer.start()
+
+    @Slot()
+    def _emit_data_changed_for_updated_items(self):
+        """Emits dataChanged for contiguous ranges of compound rows that contain updated items."""
+        updated_ids = self._updated_ids
+        self._updated_ids = {}
+        rows = []
+        for model in self.single_models:
+            ids = updated_ids.get((model.db_map, model.entity_class_id))
+            if not ids:
+                continue
+            for row, id_ in enumerate(model._main_data):
+                if id_ not in ids:
+                    continue
+                compound_row = self._inv_row_map.get((model, row))
+                if compound_row is not None:
+                    rows.append(compound_row)
+        last_column = self.columnCount() - 1
+        for first, count in rows_to_row_count_tuples(rows):
+            self.dataChanged.emit(
+                self.index(first, 0), self.index(first + count - 1, last_column), [Qt.ItemDataRole.DisplayRole]
+            )
 
     def handle_items_removed(self, db_map_data):
         """Runs when either parameter definitions or values are removed from the dbs.
@@ -395,6 +472,7 @@ class CompoundModelBase(CompoundWithEmptyTableModel):
             if db_map not in self.db_maps:
                 continue
             items_per_class = self._items_per_class(items)
+            self._remove_pending_ids(db_map, items_per_class)
             emptied_single_model_indexes = []
             for model_index, model in enumerate(self.single_models):
                 if model.db_map != db_map:
@@ -435,6 +513,24 @@ class CompoundModelBase(CompoundWithEmptyTableModel):
                 model = self.sub_models.pop(model_index)
                 model.deleteLater()
 
+    def _remove_pending_ids(self, db_map, items_per_class):
+        """Removes given items from pending ids.
+
+        Args:
+            db_map (DatabaseMapping): database map
+            items_per_class (dict): mapping from entity class id to removed items
+        """
+        for key in list(self._pending_ids):
+            pending_db_map, entity_class_id, _ = key
+            if pending_db_map is not db_map or entity_class_id not in items_per_class:
+                continue
+            removed_ids = {x["id"] for x in items_per_class[entity_class_id]}
+            ids = [id_ for id_ in self._pending_ids[key] if id_ not in removed_ids]
+            if ids:
+                self._pending_ids[key] = ids
+            else:
+                del self._pending_ids[key]
+
     def _delete_rows_from_single_model(self, model, rows_to_remove):
         """Removes rows from given single model and computes a map from original rows to retained rows.
 
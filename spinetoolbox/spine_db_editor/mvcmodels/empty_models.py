@@ -36,6 +36,7 @@ class EmptyModelBase(EmptyRowModel):
         self.db_map = None
         self.entity_class_id = None
         self._db_map_entities_to_add = {}
+        self._pending_rows = {}  # Maps unique id to rows that have been sent to the db
 
     @property
     def field_map(self):
@@ -50,9 +51,13 @@ class EmptyModelBase(EmptyRowModel):
         db_map_items = {}
         db_map_error_log = {}
         for db_map, items in db_map_data.items():
+            database = self.db_mngr.name_registry.display_name(db_map.sa_url)
             for item in items:
                 item_to_add, errors = self._convert_to_db(item)
+                row = item_to_add.get("row")
                 self._autocomplete_row(db_map, item_to_add)
+                if row is not None:
+                    self._add_pending_row(database, item_to_add, row)
                 if self._check_item(item_to_add):
                     db_map_items.setdefault(db_map, []).append(item_to_add)
                 if errors:
@@ -66,6 +71,19 @@ class EmptyModelBase(EmptyRowModel):
         if db_map_error_log:
             self.db_mngr.error_msg.emit(db_map_error_log)
 
+    def _add_pending_row(self, database, item, row):
+        """Remembers given row so it can be removed quickly once the item is in the db.
+
+        Args:
+            database (str): database display name
+            item (dict): db item made from the row
+            row (int): row index
+        """
+        row_data = self._main_data[row]
+        rows = self._pending_rows.setdefault((database, *self._make_unique_id(item)), [])
+        if not any(pending is row_data for pending in rows):
+            rows.append(row_data)
+
     def _notify_about_added_entities(self):
         editor = self.parent().parent()
         popup = AddedEntitiesPopup(editor, self.db_mngr.name_registry, self._db_map_entities_to_add)
@@ -102,19 +120,27 @@ class EmptyModelBase(EmptyRowModel):
 
     def handle_items_added(self, db_map_data):
         """Runs when parameter definitions or values are added.
-        Finds and removes model items that were successfully added to the db."""
-        added_ids = set()
+        Finds and removes model items that were successfully added to the db.
+
+        Candidate rows are looked up from pending rows by the added items' unique ids
+        so only rows that were actually sent to the db need to be converted and compared."""
+        pending_rows = {}
         for db_map, items in db_map_data.items():
             database = self.db_mngr.name_registry.display_name(db_map.sa_url)
             for item in items:
                 unique_id = (database, *self._make_unique_id(item))
-                added_ids.add(unique_id)
+                for row_data in self._pending_rows.pop(unique_id, ()):
+                    pending_rows[id(row_data)] = unique_id
+        if not pending_rows:
+            return
         removed_rows = []
-        for row in range(self.rowCount()):
+        for row, row_data in enumerate(self._main_data):
+            unique_id = pending_rows.get(id(row_data))
+            if unique_id is None:
+                continue
             item = self._make_item(row)
             database = item.get("database")
-            unique_id = (database, *self._make_unique_id(self._convert_to_db(item)[0]))
-            if unique_id in added_ids:
+            if (database, *self._make_unique_id(self._convert_to_db(item)[0])) == unique_id:
                 removed_rows.append(row)
         for row, count in sorted(rows_to_row_count_tuples(removed_rows), reverse=True):
             self.removeRows(row, count)
@@ -30,6 +30,12 @@ class EntityGroupIndex(FetchIndex):
         self.setdefault(db_map, {}).setdefault(group_id, []).append(item)
 
 
+class EntityClassGroupIndex(FetchIndex):
+    def process_item(self, item, db_map):
+        class_id = item["entity_class_id"]
+        self.setdefault(db_map, {}).setdefault(class_id, []).append(item)
+
+
 class EntityIndex(FetchIndex):
     def process_item(self, item, db_map):
         element_id_list = item["element_id_list"]
@@ -39,6 +45,7 @@ class EntityIndex(FetchIndex):
 
 class EntityTreeRootItem(MultiDBTreeItem):
     item_type = "root"
+    _hides_children = True
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -96,6 +103,20 @@ class EntityClassItem(MultiDBTreeItem):
     visual_key = ["name", "dimension_name_list", "superclass_name"]
     item_type = "entity_class"
     _fetch_index = EntityClassIndex()
+    _entity_group_index = EntityClassGroupIndex()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._group_member_counts = {}  # Maps db_map to group id to member count
+        self._entity_group_fetch_parent = FlexibleFetchParent(
+            "entity_group",
+            accepts_item=self._accepts_entity_group_item,
+            handle_items_added=self._handle_entity_group_items_added,
+            handle_items_removed=self._handle_entity_group_items_removed,
+            index=self._entity_group_index,
+            key_for_index=self._key_for_index,
+            owner=self,
+        )
 
     @property
     def display_icon(self):
@@ -154,10 +175,126 @@ class EntityClassItem(MultiDBTreeItem):
     def accepts_item(self, item, db_map):
         return item["class_id"] == self.db_map_id(db_map)
 
+    def _accepts_entity_group_item(self, item, db_map):
+        return item["entity_class_id"] == self.db_map_id(db_map)
+
     def set_data(self, column, value, role):
         """See base class."""
         return False
 
+    def _can_fetch_more_entity_groups(self):
+        result = False
+        for db_map in self.db_maps:
+            result |= self.db_mngr.can_fetch_more(db_map, self._entity_group_fetch_parent)
+        return result
+
+    def can_fetch_more(self):
+        result = self._can_fetch_more_entity_groups()
+        result |= super().can_fetch_more()
+        return result
+
+    def _fetch_more_entity_groups(self):
+        for db_map in self.db_maps:
+            self.db_mngr.fetch_more(db_map, self._entity_group_fetch_parent)
+
+    def fetch_more(self):
+        self._fetch_more_entity_groups()
+        super().fetch_more()
+
+    def handle_items_added(self, db_map_data):
+        super().handle_items_added(db_map_data)
+        self._mark_elements_having_children(db_map_data)
+
+    def _mark_elements_having_children(self, db_map_data):
+        """Makes sure the element entities of new multidimensional entities show they have children.
+
+        Entity items don't register their fetch parents before they are fetched,
+        so they won't know about new children until the user expands them.
+
+        Args:
+            db_map_data (dict): mapping from database map to list of added entity items
+        """
+        root_item = self.parent_item
+        if root_item is None:
+            return
+        for db_map, items in db_map_data.items():
+            for item in items:
+                for element_id in item["element_id_list"]:
+                    element = self.db_mngr.get_item(db_map, "entity", element_id)
+                    if not element:
+                        continue
+                    class_item = root_item.child(root_item.find_row(db_map, element["class_id"]))
+                    if class_item is None:
+                        continue
+                    element_item = class_item.child(class_item.find_row(db_map, element_id))
+                    if element_item is None or element_item.has_children():
+                        continue
+                    element_item.set_has_children_initially(True)
+                    index = element_item.index()
+                    self.model.dataChanged.emit(index, index)
+
+    def _is_group_child(self, child):
+        """Checks if given child entity is a group.
+
+        Args:
+            child (EntityItem): child item
+
+        Returns:
+            bool: True if child is a group, False otherwise
+        """
+        return any(self._group_member_counts.get(db_map, {}).get(child.db_map_id(db_map)) for db_map in child.db_maps)
+
+    def _handle_entity_group_items_added(self, db_map_data):
+        for db_map, items in db_map_data.items():
+            member_counts = self._group_member_counts.setdefault(db_map, {})
+            for item in items:
+                member_counts[item["group_id"]] = member_counts.get(item["group_id"], 0) + 1
+            self._update_group_status(db_map, {item["group_id"] for item in items})
+
+    def _handle_entity_group_items_removed(self, db_map_data):
+        for db_map, items in db_map_data.items():
+            member_counts = self._group_member_counts.get(db_map, {})
+            for item in items:
+                group_id = item["group_id"]
+                count = member_counts.get(group_id, 0) - 1
+                if count > 0:
+                    member_counts[group_id] = count
+                else:
+                    member_counts.pop(group_id, None)
+            self._update_group_status(db_map, {item["group_id"] for item in items})
+
+    def _update_group_status(self, db_map, group_ids):
+        """Updates the group status of children and moves them to correct positions.
+
+        Args:
+            db_map (DatabaseMapping): database map
+            group_ids (set of int): ids of entities whose group status may have changed
+        """
+        for group_id in group_ids:
+            child = self.child(self.find_row(db_map, group_id))
+            if child is None:
+                continue
+            is_group = self._is_group_child(child)
+            if is_group == child.is_group:
+                continue
+            child.set_group_status(is_group)
+            if is_group:
+                child.set_has_children_initially(True)
+            self.reposition_child(child.child_number())
+
+    def _insert_children_sorted(self, new_children):
+        """Reimplemented to set children's group status before they are sorted."""
+        for child in new_children:
+            child.set_group_status(self._is_group_child(child))
+        super()._insert_children_sorted(new_children)
+
+    def _register_children_fetch_parents(self, children):
+        """Reimplemented to postpone the registration until the children are fetched.
+
+        Entity classes may have a vast number of entities and most of them are never expanded;
+        registering fetch parents for each of them would make listing the entities needlessly slow.
+        """
+
     def _polish_children(self, children):
         """See base class."""
         db_map_entity_element_ids = {
@@ -166,9 +303,14 @@ class EntityClassItem(MultiDBTreeItem):
         }
         for child in children:
             child.set_has_children_initially(
-                any(child.db_map_id(db_map) in db_map_entity_element_ids.get(db_map, ()) for db_map in child.db_maps)
+                child.is_group
+                or any(child.db_map_id(db_map) in db_map_entity_element_ids.get(db_map, ()) for db_map in child.db_maps)
             )
 
+    def tear_down(self):
+        super().tear_down()
+        self._entity_group_fetch_parent.set_obsolete(True)
+
 
 class EntityItem(MultiDBTreeItem):
     """An entity item."""
@@ -182,22 +324,40 @@ class EntityItem(MultiDBTreeItem):
         super().__init__(*args, **kwargs)
         self._is_group = False
         self._is_member = is_member
-        self._entity_group_fetch_parent = FlexibleFetchParent(
-            "entity_group",
-            accepts_item=self._accepts_entity_group_item,
-            handle_items_added=self._handle_entity_group_items_added,
-            handle_items_removed=self._handle_entity_group_items_removed,
-            index=self._entity_group_index,
-            key_for_index=self._key_for_entity_group_index,
-            owner=self,
-        )
+        self._created_entity_group_fetch_parent = None
+
+    @property
+    def _entity_group_fetch_parent(self):
+        """Fetch parent for the group members; created on first access."""
+        if self._created_entity_group_fetch_parent is None:
+            self._created_entity_group_fetch_parent = FlexibleFetchParent(
+                "entity_group",
+                accepts_item=self._accepts_entity_group_item,
+                handle_items_added=self._handle_entity_group_items_added,
+                handle_items_removed=self._handle_entity_group_items_removed,
+                index=self._entity_group_index,
+                key_for_index=self._key_for_entity_group_index,
+                owner=self,
+            )
+        return self._created_entity_group_fetch_parent
 
     @property
     def is_group(self):
+        if self.parent_item is None or self.parent_item.item_type == "entity_class":
+            # Class item keeps track of its groups.
+            return self._is_group
         if not self._is_group and self._can_fetch_more_entity_groups():
             self._fetch_more_entity_groups()
         return self._is_group
 
+    def set_group_status(self, is_group):
+        """Sets group status without repositioning the item.
+
+        Args:
+            is_group (bool): True if entity is a group, False otherwise
+        """
+        self._is_group = is_group
+
     @property
     def child_item_class(self):
         """Child class is always :class:`EntityItem`."""
@@ -341,4 +501,5 @@ class EntityItem(MultiDBTreeItem):
 
     def tear_down(self):
         super().tear_down()
-        self._entity_group_fetch_parent.set_obsolete(True)
+        if self._created_entity_group_fetch_parent is not None:
+            self._created_entity_group_fetch_parent.set_obsolete(True)
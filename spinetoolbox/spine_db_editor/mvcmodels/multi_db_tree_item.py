@@ -11,9 +11,12 @@
 ######################################################################################################################
 
 """Base classes to represent items from multiple databases in a tree."""
+import bisect
+from collections import Counter
+from operator import itemgetter
 from PySide6.QtCore import Qt
 from ...fetch_parent import FlexibleFetchParent
-from ...helpers import bisect_chunks, order_key, rows_to_row_count_tuples
+from ...helpers import order_key, rows_to_row_count_tuples
 from ...mvcmodels.minimal_tree_model import TreeItem
 
 
@@ -24,6 +27,8 @@ class MultiDBTreeItem(TreeItem):
     """Item type identifier string. Should be set to a meaningful value by subclasses."""
     visual_key = ["name"]
     _fetch_index = None
+    _hides_children = False
+    """True if visible_children may differ from children."""
 
     def __init__(self, model, db_map_ids=None):
         """
@@ -36,16 +41,33 @@ class MultiDBTreeItem(TreeItem):
             db_map_ids = {}
         self._db_map_ids = db_map_ids
         self._child_map = {}  # Maps db_map to id to row number
-        self._fetch_parent = FlexibleFetchParent(
-            self.fetch_item_type,
-            accepts_item=self.accepts_item,
-            handle_items_added=self.handle_items_added,
-            handle_items_removed=self.handle_items_removed,
-            handle_items_updated=self.handle_items_updated,
-            index=self._fetch_index,
-            key_for_index=self._key_for_index,
-            owner=self,
-        )
+        self._child_sort_keys = None  # Sort keys of children in the same order, None if not computed yet
+        self._created_fetch_parent = None
+
+    @property
+    def _fetch_parent(self):
+        """Item's fetch parent; created on first access as most items never need one."""
+        if self._created_fetch_parent is None:
+            self._created_fetch_parent = FlexibleFetchParent(
+                self.fetch_item_type,
+                accepts_item=self.accepts_item,
+                handle_items_added=self.handle_items_added,
+                handle_items_removed=self.handle_items_removed,
+                handle_items_updated=self.handle_items_updated,
+                index=self._fetch_index,
+                key_for_index=self._key_for_index,
+                owner=self,
+            )
+        return self._created_fetch_parent
+
+    @property
+    def children(self):
+        return self._children
+
+    @children.setter
+    def children(self, children):
+        TreeItem.children.fset(self, children)
+        self._child_sort_keys = None
 
     @property
     def visible_children(self):
@@ -77,12 +99,49 @@ class MultiDBTreeItem(TreeItem):
         """Recomputes the child map."""
         self.model.layoutAboutToBeChanged.emit()
         self._child_map.clear()
-        for row, child in enumerate(self.visible_children):
-            for db_map in child.db_maps:
-                id_ = child.db_map_id(db_map)
-                self._child_map.setdefault(db_map, {})[id_] = row
+        self._map_children_from(0)
         self.model.layoutChanged.emit()
 
+    def _update_child_map(self, first_row, clear=False):
+        """Updates the child map after children have been inserted or removed.
+
+        Rows before first_row are assumed to be up to date and are not touched.
+        If some children may be hidden, the entire child map is refreshed instead.
+
+        Args:
+            first_row (int): first row that has changed
+            clear (bool): if True, clears the child map and recomputes it from the start
+        """
+        if self._hides_children:
+            self.refresh_child_map()
+            return
+        if clear:
+            self._child_map.clear()
+            first_row = 0
+        self._map_children_from(first_row)
+
+    def _map_children_from(self, first_row):
+        """Adds visible children to the child map starting from given row.
+
+        Args:
+            first_row (int): first row to map
+        """
+        visible_children = self.visible_children
+        for row in range(first_row, len(visible_children)):
+            for db_map, id_ in visible_children[row].db_map_ids.items():
+                self._child_map.setdefault(db_map, {})[id_] = row
+
+    def _sort_keys(self):
+        """Returns the sort keys of children computing them if needed.
+
+        Returns:
+            list: sort keys in the same order as children
+        """
+        if self._child_sort_keys is None:
+            sort_key = self._children_sort_key
+            self._child_sort_keys = [sort_key(child) for child in self.children]
+        return self._child_sort_keys
+
     def set_data(self, column, value, role):
         raise NotImplementedError()
 
@@ -276,15 +335,32 @@ class MultiDBTreeItem(TreeItem):
                 existing_children[new_child.display_id] = new_child
                 unmerged.append(new_child)
         if not unmerged:
-            self.refresh_child_map()
+            self._update_child_map(0, clear=True)
             return
         self._insert_children_sorted(unmerged)
 
     def _insert_children_sorted(self, new_children):
-        """Inserts and sorts children."""
-        new_children = sorted(new_children, key=self._children_sort_key)
-        for chunk, pos in bisect_chunks(self.children, new_children, key=self._children_sort_key):
-            self.insert_children(pos, chunk)
+        """Inserts and sorts children.
+
+        Insertion points are found by binary search over cached sort keys
+        and the child map is updated once after all children have been inserted.
+        """
+        sort_key = self._children_sort_key
+        keyed_children = sorted(((sort_key(child), child) for child in new_children), key=itemgetter(0))
+        current_keys = self._sort_keys()
+        chunks = []
+        for key, child in keyed_children:
+            position = bisect.bisect_left(current_keys, key)
+            if chunks and chunks[-1][0] == position:
+                chunks[-1][1].append(child)
+                chunks[-1][2].append(key)
+            else:
+                chunks.append((position, [child], [key]))
+        if not chunks:
+            return
+        for position, children, keys in reversed(chunks):
+            self._insert_children(position, children, keys)
+        self._update_child_map(chunks[0][0])
 
     @property
     def _children_sort_key(self):
@@ -387,26 +463,29 @@ class MultiDBTreeItem(TreeItem):
         new_children = []  # List of new children to be inserted
         for db_map, ids in db_map_ids_to_add.items():
             new_children += self._create_new_children(db_map, ids, **kwargs)
+        # Updated children may have new sort keys
+        self._child_sort_keys = None
         # Check display ids
-        display_ids = [child.display_id for child in self.children if child.display_id is not None]
+        display_ids = [child.display_id for child in self.children]
+        display_id_counts = Counter(display_ids)
         for row in sorted(rows_to_update, reverse=True):
             child = self.child(row)
             if not child:
                 continue
             if not child.is_valid():
                 self.remove_children(row, 1)
-                display_ids.pop(row)
+                display_id_counts[display_ids.pop(row)] -= 1
                 continue
             while not child.display_id:
                 # Split child until it recovers a valid display id
                 db_map = child.first_db_map
                 new_child = child.deep_take_db_map(db_map)
                 new_children.append(new_child)
-            if child.display_id in display_ids[:row] + display_ids[row + 1 :]:
+            display_id = child.display_id
+            if display_id_counts[display_id] - (display_ids[row] == display_id) > 0:
                 # Take the child and put it in the list to be merged
-                new_children.append(child)
                 self.remove_children(row, 1)
-                display_ids.pop(row)
+                display_id_counts[display_ids.pop(row)] -= 1
                 new_children.append(child)
         self.deep_refresh_children()
         self._merge_children(new_children)
@@ -421,6 +500,22 @@ class MultiDBTreeItem(TreeItem):
             position (int): insert new items here
             children (Iterable of MultiDBTreeItem): insert items from this iterable
 
+        Returns:
+            bool: True if children were inserted successfully, False otherwise
+        """
+        if not self._insert_children(position, children):
+            return False
+        self._update_child_map(position)
+        return True
+
+    def _insert_children(self, position, children, sort_keys=None):
+        """Inserts new children at given position without updating the child map.
+
+        Args:
+            position (int): insert new items here
+            children (list of MultiDBTreeItem): items to insert
+            sort_keys (list, optional): children's sort keys
+
         Returns:
             bool: True if children were inserted successfully, False otherwise
         """
@@ -429,15 +524,29 @@ class MultiDBTreeItem(TreeItem):
             raise TypeError(f"Can't insert children of type {bad_types} to an item of type {type(self)}")
         if not super().insert_children(position, children):
             return False
-        self.refresh_child_map()
+        if self._child_sort_keys is not None:
+            if sort_keys is None:
+                sort_key = self._children_sort_key
+                sort_keys = [sort_key(child) for child in children]
+            self._child_sort_keys[position:position] = sort_keys
+        self._register_children_fetch_parents(children)
+        return True
+
+    def _register_children_fetch_parents(self, children):
+        """Registers the fetch parents of newly inserted children.
+
+        Args:
+            children (list of MultiDBTreeItem): inserted children
+        """
         for child in children:
             child.register_fetch_parent()
-        return True
 
     def remove_children(self, position, count):
         """Removes count children starting from the given position."""
         if super().remove_children(position, count):
-            self.refresh_child_map()
+            if self._child_sort_keys is not None:
+                del self._child_sort_keys[position : position + count]
+            self._update_child_map(0, clear=True)
             return True
         return False
 
@@ -493,7 +602,8 @@ class MultiDBTreeItem(TreeItem):
 
     def tear_down(self):
         super().tear_down()
-        self._fetch_parent.set_obsolete(True)
+        if self._created_fetch_parent is not None:
+            self._created_fetch_parent.set_obsolete(True)
 
     def register_fetch_parent(self):
         """Registers item's fetch parent for all model's databases."""
@@ -28,9 +28,9 @@ from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
     QPainter, QPalette, QPixmap, QRadialGradient,
     QTransform)
 from PySide6.QtWidgets import (QAbstractItemView, QApplication, QDockWidget, QFrame,
-    QGraphicsView, QHBoxLayout, QHeaderView, QMainWindow,
-    QMenu, QMenuBar, QSizePolicy, QSpacerItem,
-    QVBoxLayout, QWidget)
+    QGraphicsView, QHBoxLayout, QHeaderView, QLineEdit,
+    QListView, QMainWindow, QMenu, QMenuBar,
+    QSizePolicy, QSpacerItem, QVBoxLayout, QWidget)
 
 from spinetoolbox.spine_db_editor.widgets.custom_qgraphicsviews import EntityQGraphicsView
 from spinetoolbox.spine_db_editor.widgets.custom_qtableview import (EntityAlternativeTableView, FrozenTableView, ItemMetadataTableView, MetadataTableView,
@@ -294,6 +294,19 @@ class Ui_MainWindow(object):
         self.verticalLayout_4.setSpacing(0)
         self.verticalLayout_4.setObjectName(u"verticalLayout_4")
         self.verticalLayout_4.setContentsMargins(0, 0, 0, 0)
+        self.lineEdit_entity_search = QLineEdit(self.dockWidgetContents_6)
+        self.lineEdit_entity_search.setObjectName(u"lineEdit_entity_search")
+        self.lineEdit_entity_search.setClearButtonEnabled(True)
+
+        self.verticalLayout_4.addWidget(self.lineEdit_entity_search)
+
+        self.listView_entity_search_results = QListView(self.dockWidgetContents_6)
+        self.listView_entity_search_results.setObjectName(u"listView_entity_search_results")
+        self.listView_entity_search_results.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.listView_entity_search_results.setUniformItemSizes(True)
+
+        self.verticalLayout_4.addWidget(self.listView_entity_search_results)
+
         self.treeView_entity = EntityTreeView(self.dockWidgetContents_6)
         self.treeView_entity.setObjectName(u"treeView_entity")
         sizePolicy1 = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
@@ -672,6 +685,13 @@ class Ui_MainWindow(object):
         self.tableView_parameter_definition.setAccessibleName(QCoreApplication.translate("MainWindow", u"parameter definition", None))
 #endif // QT_CONFIG(accessibility)
         self.dockWidget_entity_tree.setWindowTitle(QCoreApplication.translate("MainWindow", u"Entity tree", None))
+#if QT_CONFIG(accessibility)
+        self.lineEdit_entity_search.setAccessibleName(QCoreApplication.translate("MainWindow", u"entity search", None))
+#endif // QT_CONFIG(accessibility)
+        self.lineEdit_entity_search.setPlaceholderText(QCoreApplication.translate("MainWindow", u"Search entities...", None))
+#if QT_CONFIG(accessibility)
+        self.listView_entity_search_results.setAccessibleName(QCoreApplication.translate("MainWindow", u"entity search results", None))
+#endif // QT_CONFIG(accessibility)
 #if QT_CONFIG(accessibility)
         self.treeView_entity.setAccessibleName(QCoreApplication.translate("MainWindow", u"entity tree", None))
 #endif // QT_CONFIG(accessibility)
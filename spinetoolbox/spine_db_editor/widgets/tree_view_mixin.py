@@ -11,8 +11,9 @@
 ######################################################################################################################
 
 """Contains the TreeViewMixin class."""
-from PySide6.QtCore import QEvent, Qt, Slot
-from PySide6.QtGui import QMouseEvent
+from PySide6.QtCore import QEvent, QItemSelectionModel, QModelIndex, Qt, QTimer, Slot
+from PySide6.QtGui import QMouseEvent, QStandardItem, QStandardItemModel
+from ...helpers import DB_ITEM_SEPARATOR
 from ...spine_db_parcel import SpineDBParcel
 from ..mvcmodels.alternative_model import AlternativeModel
 from ..mvcmodels.entity_tree_models import EntityTreeModel, group_items_by_db_map
@@ -32,6 +33,9 @@ from .edit_or_remove_items_dialogs import (
     SelectSuperclassDialog,
 )
 
+_MAX_ENTITY_SEARCH_RESULTS = 500
+_ENTITY_SEARCH_RESULT_ROLE = Qt.ItemDataRole.UserRole + 1
+
 
 class TreeViewMixin:
     """Provides entity, alternative, scenario and parameter value list trees for the Spine db editor."""
@@ -60,6 +64,16 @@ class TreeViewMixin:
         self._filter_alternative_ids = {}  # Alternative ids
         self._filter_scenario_ids = {}  # Scenario ids by db_map. Each scenario id maps to alternatives sorted by rank.
         self._filter_parameter_value_ids = {}  # Entity ids for currently accepted parameter value rows in tables
+        # Entity search
+        self._entity_search_model = QStandardItemModel(self)
+        self.ui.listView_entity_search_results.setModel(self._entity_search_model)
+        self.ui.listView_entity_search_results.hide()
+        self._entity_search_timer = QTimer(self)
+        self._entity_search_timer.setSingleShot(True)
+        self._entity_search_timer.setInterval(100)
+        self._entity_to_reveal = None
+        self._entity_reveal_timer = QTimer(self)
+        self._entity_reveal_timer.setInterval(10)
 
     def connect_signals(self):
         """Connects the signals"""
@@ -71,6 +85,11 @@ class TreeViewMixin:
         )
         self.entity_alternative_model.dataChanged.connect(self.build_graph)
         self.parameter_value_model.dataChanged.connect(self._refresh_parameters_and_graph)
+        self.ui.lineEdit_entity_search.textChanged.connect(self._entity_search_timer.start)
+        self.ui.lineEdit_entity_search.returnPressed.connect(self._reveal_first_entity_search_result)
+        self._entity_search_timer.timeout.connect(self._update_entity_search_results)
+        self.ui.listView_entity_search_results.clicked.connect(self._reveal_entity_search_result)
+        self._entity_reveal_timer.timeout.connect(self._try_to_reveal_entity)
 
     def _refresh_parameters_and_graph(self):
         self._update_filter_parameter_value_ids()
@@ -196,6 +215,94 @@ class TreeViewMixin:
             for item in view.model().visit_all():
                 index = view.model().index_from_item(item)
                 view.expand(index)
+        self._entity_reveal_timer.stop()
+        self._entity_to_reveal = None
+        self._update_entity_search_results()
+
+    @Slot()
+    def _update_entity_search_results(self):
+        """Lists entities whose names match the text in the search box."""
+        self._entity_search_model.clear()
+        text = self.ui.lineEdit_entity_search.text().strip()
+        if not text:
+            self.ui.listView_entity_search_results.hide()
+            return
+        rows = []
+        index_complete = True
+        for db_map in self.db_maps:
+            limit = _MAX_ENTITY_SEARCH_RESULTS - len(rows)
+            if limit <= 0:
+                break
+            for entity_id in self.db_mngr.search_items(db_map, "entity", text, limit):
+                entity = self.db_mngr.get_item(db_map, "entity", entity_id)
+                if not entity:
+                    continue
+                label = entity["entity_class_name"] + ": " + DB_ITEM_SEPARATOR.join(entity["entity_byname"])
+                rows.append((label, db_map, entity_id))
+            index_complete = index_complete and self.db_mngr.is_search_index_complete(db_map, "entity")
+        rows.sort(key=lambda row: row[0].casefold())
+        for label, db_map, entity_id in rows:
+            item = QStandardItem(label)
+            item.setToolTip(self.db_mngr.name_registry.display_name(db_map.sa_url))
+            item.setData((db_map, entity_id), _ENTITY_SEARCH_RESULT_ROLE)
+            self._entity_search_model.appendRow(item)
+        self.ui.listView_entity_search_results.show()
+        if not index_complete:
+            # Search index is still being built in the background; refresh the results a bit later.
+            self._entity_search_timer.start()
+
+    @Slot()
+    def _reveal_first_entity_search_result(self):
+        if self._entity_search_timer.isActive():
+            self._entity_search_timer.stop()
+            self._update_entity_search_results()
+        self._reveal_entity_search_result(self._entity_search_model.index(0, 0))
+
+    @Slot(QModelIndex)
+    def _reveal_entity_search_result(self, index):
+        """Selects the entity corresponding to given search result in the entity tree.
+
+        Args:
+            index (QModelIndex): index to search result model
+        """
+        if not index.isValid():
+            return
+        self._entity_to_reveal = index.data(_ENTITY_SEARCH_RESULT_ROLE)
+        self._try_to_reveal_entity()
+        if self._entity_to_reveal is not None:
+            self._entity_reveal_timer.start()
+
+    @Slot()
+    def _try_to_reveal_entity(self):
+        """Selects the entity waiting to be revealed in the entity tree if it has been fetched already.
+        Otherwise, fetches more entities and waits."""
+        db_map, entity_id = self._entity_to_reveal
+        entity = self.db_mngr.get_item(db_map, "entity", entity_id)
+        root_item = self.entity_tree_model.root_item
+        if not entity or root_item is None:
+            self._stop_revealing_entity()
+            return
+        parent_item = root_item
+        class_row = root_item.find_row(db_map, entity["class_id"])
+        if class_row is not None:
+            parent_item = root_item.child(class_row)
+            entity_row = parent_item.find_row(db_map, entity_id)
+            if entity_row is not None:
+                self._stop_revealing_entity()
+                index = self.entity_tree_model.index_from_item(parent_item.child(entity_row))
+                view = self.ui.treeView_entity
+                view.expand(index.parent())
+                view.selectionModel().setCurrentIndex(index, QItemSelectionModel.SelectionFlag.ClearAndSelect)
+                view.scrollTo(index)
+                return
+        if parent_item.can_fetch_more():
+            parent_item.fetch_more()
+        else:
+            self._stop_revealing_entity()
+
+    def _stop_revealing_entity(self):
+        self._entity_reveal_timer.stop()
+        self._entity_to_reveal = None
 
     def _db_map_ids(self, indexes):
         return self.db_mngr.db_map_ids(group_items_by_db_map(indexes))
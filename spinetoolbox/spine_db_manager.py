@@ -59,6 +59,7 @@ from .spine_db_commands import (
     UpdateItemsCommand,
 )
 from .spine_db_icon_manager import SpineDBIconManager
+from .spine_db_search_index import SpineDBSearchIndex
 from .spine_db_worker import SpineDBWorker
 from .widgets.options_dialog import OptionsDialog
 
@@ -120,6 +121,7 @@ class SpineDBManager(QObject):
         self.undo_action = {}
         self.redo_action = {}
         self._icon_mngr = {}
+        self._search_indexes = {}
         self._connect_signals()
         self._cmd_id = 0
         self._synchronous = synchronous
@@ -229,6 +231,46 @@ class SpineDBManager(QObject):
             return
         worker.fetch_more(parent)
 
+    def search_items(self, db_map, item_type, text, limit=None):
+        """Finds items whose names contain given text, ignoring case.
+
+        The search index of an item type is built in the background on first search
+        so results may be incomplete until :meth:`is_search_index_complete` returns True.
+
+        Args:
+            db_map (DatabaseMapping): database mapping
+            item_type (str): item type, one of ``SpineDBSearchIndex.supported_item_types()``
+            text (str): text to search for
+            limit (int, optional): maximum number of results
+
+        Returns:
+            list of int: ids of matching items
+        """
+        if db_map.closed:
+            return []
+        search_index = self._search_indexes.get(db_map)
+        if search_index is None:
+            search_index = self._search_indexes[db_map] = SpineDBSearchIndex(self, db_map)
+        return search_index.search(item_type, text, limit)
+
+    def is_search_index_complete(self, db_map, item_type):
+        """Checks if all items of given type have been indexed for searching.
+
+        Args:
+            db_map (DatabaseMapping): database mapping
+            item_type (str): item type
+
+        Returns:
+            bool: True if the index is complete, False otherwise
+        """
+        search_index = self._search_indexes.get(db_map)
+        return search_index is not None and search_index.is_complete(item_type)
+
+    def _drop_search_index(self, db_map):
+        search_index = self._search_indexes.pop(db_map, None)
+        if search_index is not None:
+            search_index.tear_down()
+
     def get_icon_mngr(self, db_map):
         """Returns an icon manager for given db_map.
 
@@ -327,6 +369,7 @@ class SpineDBManager(QObject):
         db_map = self._db_maps.pop(url, None)
         if db_map is None:
             return
+        self._drop_search_index(db_map)
         worker = self._workers.pop(db_map, None)
         if worker is not None:
             worker.close_db_map()  # NOTE: This calls ThreadPoolExecutor.shutdown() which waits for Futures to finish
@@ -550,6 +593,7 @@ class SpineDBManager(QObject):
             except KeyError:
                 continue
             is_dirty = not self.undo_stack[db_map].isClean()
+            self._drop_search_index(db_map)
             worker.refresh_session()
             self.undo_stack[db_map].clear()
             if is_dirty:
@@ -565,6 +609,7 @@ class SpineDBManager(QObject):
                 worker = self._get_worker(db_map)
             except KeyError:
                 continue
+            self._drop_search_index(db_map)
             worker.reset_session()
             self.undo_stack[db_map].clear()
             reset_db_maps.add(db_map)
@@ -0,0 +1,199 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Toolbox contributors
+# This file is part of Spine Toolbox.
+# Spine Toolbox is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Contains in-memory indexes for searching database items by name."""
+from itertools import islice
+from .fetch_parent import FlexibleFetchParent
+from .helpers import DB_ITEM_SEPARATOR
+
+
+def _trigrams(text):
+    """Returns the set of three character substrings in text.
+
+    Args:
+        text (str): text
+
+    Returns:
+        set of str: trigrams
+    """
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class NameIndex:
+    """A trigram index for case-insensitive substring searches over item names."""
+
+    def __init__(self):
+        self._texts = {}
+        self._ids_by_trigram = {}
+
+    def __len__(self):
+        return len(self._texts)
+
+    def add(self, id_, names):
+        """Adds an item to the index replacing the previous names if the item exists already.
+
+        Args:
+            id_ (Any): item id
+            names (Iterable of str): names by which the item can be found
+        """
+        self.remove(id_)
+        text = "\n".join(names).casefold()
+        self._texts[id_] = text
+        for trigram in _trigrams(text):
+            self._ids_by_trigram.setdefault(trigram, set()).add(id_)
+
+    def remove(self, id_):
+        """Removes an item from the index.
+
+        Args:
+            id_ (Any): item id
+        """
+        text = self._texts.pop(id_, None)
+        if text is None:
+            return
+        for trigram in _trigrams(text):
+            ids = self._ids_by_trigram[trigram]
+            ids.discard(id_)
+            if not ids:
+                del self._ids_by_trigram[trigram]
+
+    def search(self, text, limit=None):
+        """Finds items whose names contain given text.
+
+        Args:
+            text (str): text to search for
+            limit (int, optional): maximum number of results
+
+        Returns:
+            list: ids of matching items in no particular order
+        """
+        text = text.casefold()
+        if not text:
+            return []
+        trigrams = _trigrams(text)
+        if not trigrams:
+            matches = (id_ for id_, item_text in self._texts.items() if text in item_text)
+            return list(islice(matches, limit))
+        id_sets = sorted((self._ids_by_trigram.get(trigram, set()) for trigram in trigrams), key=len)
+        candidates = id_sets[0].intersection(*id_sets[1:])
+        if len(trigrams) == 1 and len(text) == 3:
+            return list(islice(candidates, limit))
+        texts = self._texts
+        matches = (id_ for id_ in candidates if text in texts[id_])
+        return list(islice(matches, limit))
+
+
+def _entity_names(item):
+    if item["element_id_list"]:
+        return item["name"], DB_ITEM_SEPARATOR.join(item["entity_byname"])
+    return (item["name"],)
+
+
+def _names(item):
+    return (item["name"],)
+
+
+class SpineDBSearchIndex:
+    """Keeps name indexes of a database mapping up to date.
+
+    The index for an item type is built on first search by fetching all items of that type in the background;
+    after that it follows additions, updates and removals through a fetch parent.
+    """
+
+    _NAME_GETTERS = {"entity": _entity_names, "alternative": _names, "scenario": _names}
+
+    def __init__(self, db_mngr, db_map):
+        """
+        Args:
+            db_mngr (SpineDBManager): database manager
+            db_map (DatabaseMapping): database mapping to index
+        """
+        self._db_mngr = db_mngr
+        self._db_map = db_map
+        self._indexes = {}
+        self._fetch_parents = {}
+
+    @classmethod
+    def supported_item_types(cls):
+        """Returns item types that can be searched.
+
+        Returns:
+            tuple of str: item types
+        """
+        return tuple(cls._NAME_GETTERS)
+
+    def search(self, item_type, text, limit=None):
+        """Finds items whose names contain given text.
+
+        Results may be incomplete while the index is still being built, see :meth:`is_complete`.
+
+        Args:
+            item_type (str): item type
+            text (str): text to search for
+            limit (int, optional): maximum number of results
+
+        Returns:
+            list of int: ids of matching items
+        """
+        return self._index(item_type).search(text, limit)
+
+    def is_complete(self, item_type):
+        """Checks if all items of given type have been indexed.
+
+        Args:
+            item_type (str): item type
+
+        Returns:
+            bool: True if index is complete, False otherwise
+        """
+        fetch_parent = self._fetch_parents.get(item_type)
+        return fetch_parent is not None and fetch_parent.is_fetched
+
+    def tear_down(self):
+        """Stops following database changes."""
+        for fetch_parent in self._fetch_parents.values():
+            fetch_parent.set_obsolete(True)
+        self._fetch_parents.clear()
+        self._indexes.clear()
+
+    def _index(self, item_type):
+        """Returns the name index for given item type and starts building it if needed.
+
+        Args:
+            item_type (str): item type
+
+        Returns:
+            NameIndex: index
+        """
+        index = self._indexes.get(item_type)
+        if index is not None:
+            return index
+        get_names = self._NAME_GETTERS[item_type]
+        index = self._indexes[item_type] = NameIndex()
+
+        def add_items(db_map_data):
+            for item in db_map_data.get(self._db_map, ()):
+                index.add(item["id"], get_names(item))
+
+        def remove_items(db_map_data):
+            for item in db_map_data.get(self._db_map, ()):
+                index.remove(item["id"])
+
+        fetch_parent = self._fetch_parents[item_type] = FlexibleFetchParent(
+            item_type,
+            handle_items_added=add_items,
+            handle_items_removed=remove_items,
+            handle_items_updated=add_items,
+            chunk_size=None,
+        )
+        self._db_mngr.fetch_more(self._db_map, fetch_parent)
+        return index
@@ -13,7 +13,9 @@
 """Unit tests for the models in ``compound_models`` module."""
 from itertools import product
 import unittest
+from PySide6.QtCore import Qt
 from spinedb_api import Array, to_database
+from spinetoolbox.helpers import signal_waiter
 from spinetoolbox.spine_db_editor.mvcmodels.compound_models import (
     CompoundParameterDefinitionModel,
     CompoundParameterValueModel,
@@ -81,6 +83,25 @@ class TestCompoundParameterDefinitionModel(TestBase):
         self._db_mngr.remove_items({self._db_map: {"entity_class": [entity_class_2["id"]]}})
         self.assertEqual(model.rowCount(), 1)
 
+    def test_single_models_of_filtered_out_classes_are_created_when_class_filter_accepts_them(self):
+        entity_class_1 = self.assert_success(self._db_map.add_entity_class_item(name="oc1"))
+        self._db_map.add_parameter_definition_item(entity_class_name="oc1", name="x")
+        entity_class_2 = self.assert_success(self._db_map.add_entity_class_item(name="oc2"))
+        self._db_map.add_parameter_definition_item(entity_class_name="oc2", name="y")
+        model = CompoundParameterDefinitionModel(self._db_editor, self._db_mngr, self._db_map)
+        model.init_model()
+        model.set_filter_class_ids({self._db_map: {entity_class_1["id"]}})
+        fetch_model(model)
+        self.assertEqual([m.entity_class_id for m in model.single_models], [entity_class_1["id"]])
+        self.assertEqual(model.rowCount(), 2)
+        model.set_filter_class_ids({self._db_map: {entity_class_2["id"]}})
+        model.refresh()
+        self.assertEqual(
+            sorted(m.entity_class_id for m in model.single_models), sorted([entity_class_1["id"], entity_class_2["id"]])
+        )
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.index(0, 1).data(), "y")
+
     def test_index_name_returns_sane_label(self):
         self.assert_success(self._db_map.add_entity_class_item(name="Object"))
         value, value_type = to_database(Array([2.3]))
@@ -727,6 +748,41 @@ class TestCompoundParameterValueModel(TestBase):
             with self.subTest(row=row, column=column):
                 self.assertEqual(model.index(row, column).data(), expected[row][column])
 
+    def test_updating_value_emits_data_changed_for_its_row_only(self):
+        self.assert_success(self._db_map.add_entity_class_item(name="Object"))
+        self.assert_success(self._db_map.add_parameter_definition_item(name="X", entity_class_name="Object"))
+        value_items = []
+        for entity_name in ("cube", "pyramid", "sphere"):
+            self.assert_success(self._db_map.add_entity_item(name=entity_name, entity_class_name="Object"))
+            value, value_type = to_database(2.3)
+            value_items.append(
+                self.assert_success(
+                    self._db_map.add_parameter_value_item(
+                        entity_class_name="Object",
+                        entity_byname=(entity_name,),
+                        parameter_definition_name="X",
+                        alternative_name="Base",
+                        value=value,
+                        type=value_type,
+                    )
+                )
+            )
+        model = CompoundParameterValueModel(self._db_editor, self._db_mngr, self._db_map)
+        model.init_model()
+        fetch_model(model)
+        self.assertEqual(model.rowCount(), 4)
+        value, value_type = to_database(-5.0)
+        with signal_waiter(model.dataChanged, timeout=1.0) as waiter:
+            self._db_mngr.update_parameter_values(
+                {self._db_map: [{"id": value_items[1]["id"], "value": value, "type": value_type}]}
+            )
+            waiter.wait()
+            top_left, bottom_right, roles = waiter.args
+        self.assertEqual((top_left.row(), top_left.column()), (1, 0))
+        self.assertEqual((bottom_right.row(), bottom_right.column()), (1, model.columnCount() - 1))
+        self.assertEqual(roles, [Qt.ItemDataRole.DisplayRole])
+        self.assertEqual(model.index(1, 4).data(), "-5.0")
+
 
 if __name__ == "__main__":
     unittest.main()
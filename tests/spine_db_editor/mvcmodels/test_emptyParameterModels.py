@@ -112,6 +112,29 @@ class TestEmptyParameterModel(TestCaseWithQApplication):
         self.assertEqual(values[0]["parameter_name"], "breed")
         self.assertEqual(values[0]["value"], value)
 
+    def test_handle_items_added_removes_rows_that_were_added_to_db(self):
+        model = TestEmptyParameterValueModel(self._db_mngr)
+        fetch_model(model)
+        value, value_type = to_database("bloodhound")
+        self.assertTrue(
+            model.batch_set_data(
+                _empty_indexes(model),
+                ["dog", "pluto", "breed", "Base", join_value_and_type(value, value_type), "mock_db"],
+            )
+        )
+        self.assertTrue(
+            model.batch_set_data(
+                [model.index(1, model.header.index(field)) for field in model.header],
+                ["fish", "nemo", "water", "Base", "salty", "mock_db"],
+            )
+        )
+        self.assertEqual(model.rowCount(), 3)
+        values = self._db_mngr.get_items(self._db_map, "parameter_value")
+        self.assertEqual(len(values), 1)
+        model.handle_items_added({self._db_map: values})
+        self.assertEqual(model.rowCount(), 2)
+        self.assertEqual(model.index(0, 0).data(), "fish")
+
     def test_add_relationship_parameter_values_to_db(self):
         """Test that relationship parameter values are added to the db when editing the table."""
         model = TestEmptyParameterValueModel(self._db_mngr)
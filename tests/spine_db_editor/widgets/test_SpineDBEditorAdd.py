@@ -51,6 +51,27 @@ class TestSpineDBEditorAdd(DBEditorTestBase):
         self.assertEqual(scooby_item.display_data, "scooby")
         self.assertEqual(dog_item.child_count(), 2)
 
+    def test_entities_added_after_fetching_are_inserted_in_sorted_order(self):
+        self.spine_db_editor.init_models()
+        self.put_mock_object_classes_in_db_mngr()
+        self.put_mock_objects_in_db_mngr()
+        self.fetch_entity_tree_model()
+        root_item = self.spine_db_editor.entity_tree_model.root_item
+        dog_item = next(x for x in root_item.children if x.display_data == "dog")
+        self.spine_db_editor.db_mngr.add_entities(
+            {
+                self.mock_db_map: [
+                    {"class_id": self.dog_class["id"], "name": name} for name in ("snoopy", "brian", "odie", "rex")
+                ]
+            }
+        )
+        self.assertEqual(
+            [child.display_data for child in dog_item.children], ["brian", "odie", "pluto", "rex", "scooby", "snoopy"]
+        )
+        for row, child in enumerate(dog_item.children):
+            with self.subTest(name=child.display_data):
+                self.assertEqual(dog_item.find_row(self.mock_db_map, child.db_map_id(self.mock_db_map)), row)
+
     def test_add_relationship_classes_to_object_tree_model(self):
         """Test that entity classes are added to the object tree model."""
         self.spine_db_editor.init_models()
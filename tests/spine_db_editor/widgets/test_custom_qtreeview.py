@@ -24,6 +24,7 @@ from spinedb_api import (
     import_entity_classes,
     import_parameter_value_lists,
 )
+from spinedb_api.import_functions import import_entity_groups
 from spinetoolbox.helpers import signal_waiter
 from spinetoolbox.spine_db_editor.widgets.add_items_dialogs import AddEntitiesDialog, AddEntityClassesDialog
 from spinetoolbox.spine_db_editor.widgets.edit_or_remove_items_dialogs import (
@@ -578,6 +579,50 @@ class TestEntityTreeViewWithExistingMultidimensionalEntities(TestBase):
         database_index = model.index(1, 1, class_index)
         self.assertEqual(database_index.data(), self.db_codename)
 
+    def test_entity_items_register_fetch_parents_when_fetched(self):
+        view = self._db_editor.ui.treeView_entity
+        model = view.model()
+        root_index = model.index(0, 0)
+        class_index = model.index(0, 0, root_index)
+        self.assertEqual(class_index.data(), "object_class_1")
+        model.fetchMore(class_index)
+        while model.rowCount(class_index) != 2:
+            QApplication.processEvents()
+        entity_index = model.index(0, 0, class_index)
+        self.assertEqual(entity_index.data(), "object_11")
+        entity_item = model.item_from_index(entity_index)
+        self.assertIsNone(entity_item._created_fetch_parent)
+        self.assertTrue(model.hasChildren(entity_index))
+        self.assertFalse(model.hasChildren(model.index(1, 0, class_index)))
+        self.assertTrue(model.canFetchMore(entity_index))
+        self.assertIsNotNone(entity_item._created_fetch_parent)
+
+    def test_adding_multidimensional_entity_marks_element_as_having_children(self):
+        view = self._db_editor.ui.treeView_entity
+        model = view.model()
+        root_index = model.index(0, 0)
+        class_index = model.index(0, 0, root_index)
+        model.fetchMore(class_index)
+        while model.rowCount(class_index) != 2:
+            QApplication.processEvents()
+        relationship_class_index = model.index(2, 0, root_index)
+        model.fetchMore(relationship_class_index)
+        while model.rowCount(relationship_class_index) != 2:
+            QApplication.processEvents()
+        entity_index = model.index(1, 0, class_index)
+        self.assertEqual(entity_index.data(), "object_12")
+        self.assertFalse(model.hasChildren(entity_index))
+        self._db_mngr.add_entities(
+            {self._db_map: [{"class_id": 3, "element_id_list": [2, 3], "name": "object_12__object_21"}]}
+        )
+        while model.rowCount(relationship_class_index) != 3:
+            QApplication.processEvents()
+        self.assertTrue(model.hasChildren(entity_index))
+        model.fetchMore(entity_index)
+        while model.rowCount(entity_index) != 1:
+            QApplication.processEvents()
+        self.assertEqual(model.index(0, 0, entity_index).data(), "\u066D ǀ object_21")
+
     def test_rename_multidimensional_entity_class(self):
         view = self._db_editor.ui.treeView_entity
         model = view.model()
@@ -827,6 +872,47 @@ class TestEntityTreeViewSorting(TestBase):
         self.assertEqual(expected, result)
 
 
+class TestEntityTreeViewWithExistingGroups(TestBase):
+    def setUp(self):
+        self._temp_dir = TemporaryDirectory()
+        url = "sqlite:///" + os.path.join(self._temp_dir.name, "test_database.sqlite")
+        db_map = DatabaseMapping(url, create=True)
+        import_entity_classes(db_map, (("fruit",),))
+        import_entities(db_map, (("fruit", "apple"), ("fruit", "banana"), ("fruit", "yellow")))
+        import_entity_groups(db_map, (("fruit", "yellow", "banana"),))
+        db_map.commit_session("Add groups.")
+        db_map.close()
+        self._common_setup(url, create=False)
+        model = self._db_editor.ui.treeView_entity.model()
+        root_index = model.index(0, 0)
+        while model.rowCount(root_index) != 1:
+            QApplication.processEvents()
+
+    def tearDown(self):
+        self._common_tear_down()
+        self._temp_dir.cleanup()
+
+    def test_groups_are_sorted_first_and_show_their_members(self):
+        model = self._db_editor.ui.treeView_entity.model()
+        root_index = model.index(0, 0)
+        class_index = model.index(0, 0, root_index)
+        while model.canFetchMore(class_index):
+            model.fetchMore(class_index)
+            QApplication.processEvents()
+        while model.rowCount(class_index) != 3:
+            QApplication.processEvents()
+        self.assertEqual([model.index(row, 0, class_index).data() for row in range(3)], ["yellow", "apple", "banana"])
+        group_index = model.index(0, 0, class_index)
+        self.assertTrue(model.item_from_index(group_index).is_group)
+        self.assertTrue(model.hasChildren(group_index))
+        while model.canFetchMore(group_index):
+            model.fetchMore(group_index)
+            QApplication.processEvents()
+        while model.rowCount(group_index) != 1:
+            QApplication.processEvents()
+        self.assertEqual(model.index(0, 0, group_index).data(), "banana")
+
+
 class TestParameterValueListTreeViewWithInitiallyEmptyDatabase(TestBase):
     def setUp(self):
         self._common_setup("sqlite://", create=True)
@@ -567,5 +567,65 @@ class TestRemoveScenarioAlternative(TestCaseWithQApplication):
         self._db_mngr.error_msg.emit.assert_not_called()
 
 
+class TestSearchItems(TestCaseWithQApplication):
+    def setUp(self):
+        mock_settings = MagicMock()
+        mock_settings.value.side_effect = lambda *args, **kwargs: 0
+        self._db_mngr = SpineDBManager(mock_settings, None)
+        self._logger = MagicMock()
+        self._db_map = self._db_mngr.get_db_map("sqlite://", self._logger, create=True)
+
+    def tearDown(self):
+        self._db_mngr.close_all_sessions()
+        while not self._db_map.closed:
+            QApplication.processEvents()
+        self._db_mngr.clean_up()
+
+    def _wait_for_search_index(self, item_type):
+        while not self._db_mngr.is_search_index_complete(self._db_map, item_type):
+            QApplication.processEvents()
+        QApplication.processEvents()
+
+    def test_search_entities_follows_additions_updates_and_removals(self):
+        self._db_map.add_entity_class_item(name="fruit")
+        self._db_map.add_entity_class_item(name="basket", dimension_name_list=("fruit",))
+        apple, error = self._db_map.add_entity_item(entity_class_name="fruit", name="apple")
+        self.assertIsNone(error)
+        self._db_mngr.commit_session("Add apple.", self._db_map)
+        self.assertEqual(self._db_mngr.search_items(self._db_map, "entity", "pp"), [])
+        self._wait_for_search_index("entity")
+        self.assertEqual(self._db_mngr.search_items(self._db_map, "entity", "pp"), [apple["id"]])
+        with signal_waiter(self._db_mngr.items_added, timeout=5.0) as waiter:
+            self._db_mngr.add_items("entity", {self._db_map: [{"class_id": apple["class_id"], "name": "pear"}]})
+            waiter.wait()
+        pear = self._db_map.get_entity_item(entity_class_name="fruit", name="pear")
+        with signal_waiter(self._db_mngr.items_added, timeout=5.0) as waiter:
+            self._db_mngr.add_items(
+                "entity",
+                {self._db_map: [{"entity_class_name": "basket", "element_name_list": ("pear",), "name": "my_basket"}]},
+            )
+            waiter.wait()
+        basket = self._db_map.get_entity_item(entity_class_name="basket", name="my_basket")
+        QApplication.processEvents()
+        self.assertCountEqual(self._db_mngr.search_items(self._db_map, "entity", "pear"), [pear["id"], basket["id"]])
+        with signal_waiter(self._db_mngr.items_updated, timeout=5.0) as waiter:
+            self._db_mngr.update_items("entity", {self._db_map: [{"id": apple["id"], "name": "orange"}]})
+            waiter.wait()
+        QApplication.processEvents()
+        self.assertEqual(self._db_mngr.search_items(self._db_map, "entity", "pp"), [])
+        self.assertEqual(self._db_mngr.search_items(self._db_map, "entity", "Oran"), [apple["id"]])
+        with signal_waiter(self._db_mngr.items_removed, timeout=5.0) as waiter:
+            self._db_mngr.remove_items({self._db_map: {"entity": {apple["id"]}}})
+            waiter.wait()
+        QApplication.processEvents()
+        self.assertEqual(self._db_mngr.search_items(self._db_map, "entity", "orange"), [])
+
+    def test_search_alternatives(self):
+        self._db_mngr.search_items(self._db_map, "alternative", "base")
+        self._wait_for_search_index("alternative")
+        base = self._db_map.get_alternative_item(name="Base")
+        self.assertEqual(self._db_mngr.search_items(self._db_map, "alternative", "base"), [base["id"]])
+
+
 if __name__ == "__main__":
     unittest.main()
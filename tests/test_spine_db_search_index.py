@@ -0,0 +1,62 @@
+######################################################################################################################
+# Copyright (C) 2017-2022 Spine project consortium
+# Copyright Spine Toolbox contributors
+# This file is part of Spine Toolbox.
+# Spine Toolbox is free software: you can redistribute it and/or modify it under the terms of the GNU Lesser General
+# Public License as published by the Free Software Foundation, either version 3 of the License, or (at your option)
+# any later version. This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY;
+# without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Lesser General
+# Public License for more details. You should have received a copy of the GNU Lesser General Public License along with
+# this program. If not, see <http://www.gnu.org/licenses/>.
+######################################################################################################################
+
+"""Unit tests for the ``spine_db_search_index`` module."""
+import unittest
+from spinetoolbox.spine_db_search_index import NameIndex
+
+
+class TestNameIndex(unittest.TestCase):
+    def setUp(self):
+        self._index = NameIndex()
+        self._index.add(1, ("apple",))
+        self._index.add(2, ("pineapple",))
+        self._index.add(3, ("Banana", "fruit__Banana"))
+
+    def test_empty_text_finds_nothing(self):
+        self.assertEqual(self._index.search(""), [])
+
+    def test_search_is_case_insensitive(self):
+        self.assertCountEqual(self._index.search("APPLE"), [1, 2])
+        self.assertCountEqual(self._index.search("bAn"), [3])
+
+    def test_short_texts_are_searched_too(self):
+        self.assertCountEqual(self._index.search("p"), [1, 2])
+        self.assertCountEqual(self._index.search("na"), [3])
+
+    def test_any_name_of_item_can_match(self):
+        self.assertEqual(self._index.search("fruit__"), [3])
+
+    def test_trigrams_must_appear_in_sequence(self):
+        self.assertEqual(self._index.search("applepine"), [])
+        self.assertEqual(self._index.search("leapp"), [])
+
+    def test_limit(self):
+        self.assertEqual(len(self._index.search("apple", limit=1)), 1)
+        self.assertEqual(len(self._index.search("a", limit=2)), 2)
+
+    def test_remove(self):
+        self._index.remove(1)
+        self.assertEqual(self._index.search("apple"), [2])
+        self.assertEqual(len(self._index), 2)
+        self._index.remove(1)
+        self.assertEqual(len(self._index), 2)
+
+    def test_adding_existing_item_replaces_its_names(self):
+        self._index.add(1, ("cherry",))
+        self.assertEqual(self._index.search("apple"), [2])
+        self.assertEqual(self._index.search("cherry"), [1])
+        self.assertEqual(len(self._index), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()